@@ -0,0 +1,92 @@
+"""Measure import-to-first-request latency of the API.
+
+Every run starts a fresh interpreter so the numbers reflect a cold start.
+
+Usage:
+    python benchmarks/startup_benchmark.py --runs 10
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Code executed in the fresh interpreter, prints the timings as json
+CHILD_SCRIPT = """
+import json, time
+start = time.perf_counter()
+
+from main import app
+imported = time.perf_counter()
+
+# Test harness import, timed separately so it is not counted as app startup
+from fastapi.testclient import TestClient
+harness_imported = time.perf_counter()
+
+with TestClient(app) as client:
+    started = time.perf_counter()
+    response = client.get("/")
+    first_response = time.perf_counter()
+
+assert response.status_code == 200, response.status_code
+import_ms = (imported - start) * 1000
+lifespan_ms = (started - harness_imported) * 1000
+first_request_ms = (first_response - started) * 1000
+print(json.dumps({
+    "import_ms": import_ms,
+    "lifespan_ms": lifespan_ms,
+    "first_request_ms": first_request_ms,
+    "total_ms": import_ms + lifespan_ms + first_request_ms,
+    "harness_import_ms": (harness_imported - imported) * 1000,
+}))
+"""
+
+
+def run_once(environment: dict) -> dict:
+    """Start the app in a fresh interpreter and return its timings."""
+
+    try:
+        completed = subprocess.run(
+            [sys.executable, "-c", CHILD_SCRIPT],
+            cwd=PROJECT_ROOT,
+            env=environment,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+    except subprocess.CalledProcessError as error:
+        print(error.stderr, file=sys.stderr) # show why the app failed to start
+        raise
+
+    output_lines = completed.stdout.strip().splitlines()
+    if not output_lines:
+        raise RuntimeError(f"Benchmark run printed no timings.\n{completed.stderr}")
+
+    return json.loads(output_lines[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="number of cold starts to measure")
+    args = parser.parse_args()
+
+    # The root endpoint never touches the database, so placeholders are enough
+    environment = os.environ.copy()
+    environment.setdefault("DATABASE_URL", "sqlite://")
+    environment.setdefault("JWT_SECRET", "benchmark-secret")
+    environment.setdefault("JWT_ALGORITHM", "HS256")
+
+    results = [run_once(environment) for _ in range(args.runs)]
+
+    print(f"{'stage':<20}{'median ms':>12}{'min ms':>12}{'max ms':>12}")
+    for stage in ("import_ms", "lifespan_ms", "first_request_ms", "total_ms", "harness_import_ms"):
+        values = [result[stage] for result in results]
+        print(f"{stage:<20}{statistics.median(values):>12.1f}{min(values):>12.1f}{max(values):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,40 @@
+from functools import lru_cache
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, Engine
 from sqlalchemy.orm import sessionmaker
-from dotenv import load_dotenv
 from typing import Generator
-import os
+from utils.config import get_settings
 
-load_dotenv() # load environment variable
 
+#Create the Base class
+class Base(DeclarativeBase):
+    pass
 
-DATABASE_URL = os.environ.get("DATABASE_URL")
-engine = create_engine(DATABASE_URL) #Create database engine
 
-#Create the session factory
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+@lru_cache
+def get_engine() -> Engine:
+    """Create the database engine on first use and return it."""
 
+    return create_engine(get_settings().database_url)
 
-#Create the Base class
-class Base(DeclarativeBase):
-    pass
+
+@lru_cache
+def get_session_factory() -> sessionmaker:
+    """Create the session factory on first use and return it."""
+
+    return sessionmaker(bind=get_engine(), autoflush=False, autocommit=False)
+
+
+def dispose_engine() -> None:
+    """Close pooled connections if the engine has been created."""
+
+    if get_engine.cache_info().currsize:
+        get_engine().dispose()
 
 
 def get_db() -> Generator:
-    db = SessionLocal()
+    db = get_session_factory()()
     try:
         yield db   # give the session to the request
     finally:
-        db.close() # close it after request ends
\ No newline at end of file
+        db.close() # close it after request ends
@@ -0,0 +1,12 @@
+from db.database import Base, get_engine
+import models.models  # noqa: F401 - registers the tables on Base.metadata
+
+
+def migrate() -> None:
+    """Create every table that does not exist yet."""
+
+    Base.metadata.create_all(bind=get_engine())
+
+
+if __name__ == "__main__":
+    migrate()
@@ -1,25 +1,40 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from routes.user_routes import router as user_router
 from routes.image_routes import router as image_router
 from routes.auth_routes import router as auth_router
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
-from db.database import Base, engine
+from db.database import dispose_engine
+from utils.config import get_settings
+from utils.image_utils import preload_image_plugins
 from utils.limiter import limiter
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run startup work once the server starts instead of at import time."""
+
+    settings = get_settings() # validate settings, fail fast if any is missing
+    settings.upload_dir.mkdir(parents=True, exist_ok=True) #create the directory if it does not exist
+    preload_image_plugins()
+
+    yield
+
+    dispose_engine()
+
+
 app = FastAPI(
     title="Image Processing API",
     description="Backend service for image uploads and transformations",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Essential setup for SlowAPI
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
-# Create tables
-Base.metadata.create_all(bind=engine)
-
 
 # Routers
 app.include_router(user_router)
@@ -29,8 +44,3 @@ app.include_router(auth_router)
 @app.get("/", tags=["root"])
 async def root():
     return {"message": "Welcome to Image Processing Service"}
-
-
-
-
-
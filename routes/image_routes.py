@@ -9,16 +9,14 @@ from utils.auth_utils import get_current_user
 from db.database import get_db
 from schemas.user_schema import GetUser
 from PIL import Image as PILImage, UnidentifiedImageError
-from utils.image_utils import transform_image, delete_image_duplicate
+from utils.image_utils import transform_image, delete_image_duplicate, ACCEPTED_IMAGE_FORMATS
+from utils.config import get_settings
 import os
 
 from utils.limiter import limiter
 
 router = APIRouter(prefix="/images", tags=["Images"])
 
-UPLOAD_DIR = Path("uploads")
-UPLOAD_DIR.mkdir(exist_ok=True) #create the directory if it does not exist
-
 @router.post("/", response_model=ImageResponse)
 async def upload_image_file(
         file: UploadFile = File(),
@@ -38,22 +36,22 @@ async def upload_image_file(
 
     # Validate image integrity using Pillow
     try:
-        pillow_image = PILImage.open(BytesIO(file_content_bytes))
+        pillow_image = PILImage.open(BytesIO(file_content_bytes), formats=ACCEPTED_IMAGE_FORMATS)
         pillow_image.verify()
     except UnidentifiedImageError:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Uploaded file is not a valid image."
+            detail=f"Unsupported or invalid image. Accepted formats: {', '.join(ACCEPTED_IMAGE_FORMATS)}."
         )
 
     # Reopen the image (verify() closes the file internally)
-    pillow_image = PILImage.open(BytesIO(file_content_bytes))
+    pillow_image = PILImage.open(BytesIO(file_content_bytes), formats=ACCEPTED_IMAGE_FORMATS)
     image_width, image_height = pillow_image.size
 
     # Generate a unique file name and determine save path
     extension = file.filename.split(".")[-1].lower()
     unique_image_name = f"{uuid.uuid4()}.{extension}"
-    saved_image_path = UPLOAD_DIR / unique_image_name
+    saved_image_path = get_settings().upload_dir / unique_image_name
 
     # Save image to uploads directory
     with open(saved_image_path, "wb") as image_buffer:
@@ -1,21 +1,15 @@
-from dotenv import load_dotenv
 from pwdlib import PasswordHash
 from datetime import datetime, timedelta, timezone
 from fastapi.security import OAuth2PasswordBearer
 from fastapi import HTTPException, status, Depends
 from schemas.token_schema import TokenData
+from utils.config import get_settings
 from jwt.exceptions import InvalidTokenError
-import os
 import jwt
 
-load_dotenv() # load environment variables
-
 password_hash = PasswordHash.recommended()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login")
 
-SECRET_KEY = os.environ.get("JWT_SECRET")
-ALGORITHM = os.environ.get("JWT_ALGORITHM")
-ACCESS_TOKEN_EXPIRE_MINUTES=60
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify if plain and hashed password is the same."""
@@ -32,11 +26,12 @@ def get_password_hash(password: str) -> str:
 def create_access_token(data: dict) -> str:
     """create access token using jwt, and return it."""
 
+    settings = get_settings()
     to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    expire = datetime.now(timezone.utc) + timedelta(minutes=settings.access_token_expire_minutes)
     to_encode.update({"exp": expire})
 
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, settings.jwt_secret, algorithm=settings.jwt_algorithm)
     return encoded_jwt
 
 
@@ -49,8 +44,10 @@ async def get_current_user(token: str = Depends(oauth2_scheme), ) -> TokenData:
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+    settings = get_settings()
+
     try:
-        pay_load = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        pay_load = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
 
         user_id: int = pay_load.get("user_id")
         username: str = pay_load.get("username")
@@ -0,0 +1,46 @@
+from functools import lru_cache
+from pathlib import Path
+from dotenv import load_dotenv
+from pydantic import BaseModel, ValidationError
+import os
+
+
+class Settings(BaseModel):
+    database_url: str
+    jwt_secret: str
+    jwt_algorithm: str
+    access_token_expire_minutes: int = 60
+    upload_dir: Path = Path("uploads")
+
+
+# Environment variable each setting is read from
+ENVIRONMENT_VARIABLES = {
+    "database_url": "DATABASE_URL",
+    "jwt_secret": "JWT_SECRET",
+    "jwt_algorithm": "JWT_ALGORITHM",
+    "access_token_expire_minutes": "ACCESS_TOKEN_EXPIRE_MINUTES",
+    "upload_dir": "UPLOAD_DIR",
+}
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Load environment variables once, validate them and return the settings."""
+
+    load_dotenv() # load environment variables
+
+    environment = {field: os.environ.get(variable) for field, variable in ENVIRONMENT_VARIABLES.items()}
+
+    # Drop unset variables so that missing required ones fail validation and optional ones use defaults
+    try:
+        return Settings(**{key: value for key, value in environment.items() if value is not None})
+    except ValidationError as error:
+        missing = [ENVIRONMENT_VARIABLES[e["loc"][0]] for e in error.errors() if e["type"] == "missing"]
+        invalid = [ENVIRONMENT_VARIABLES[e["loc"][0]] for e in error.errors() if e["type"] != "missing"]
+
+        problems = []
+        if missing:
+            problems.append(f"Missing required environment variable(s): {', '.join(missing)}")
+        if invalid:
+            problems.append(f"Invalid environment variable(s): {', '.join(invalid)}")
+        raise RuntimeError("; ".join(problems)) from None
@@ -1,7 +1,29 @@
+import importlib
 from pathlib import Path
 from typing import Dict
 from PIL import Image, ImageDraw, ImageFont
 
+# Image formats accepted on upload, mapped to the Pillow plugin that handles them
+IMAGE_FORMAT_PLUGINS = {
+    "JPEG": "JpegImagePlugin",
+    "PNG": "PngImagePlugin",
+    "WEBP": "WebPImagePlugin",
+    "GIF": "GifImagePlugin",
+    "BMP": "BmpImagePlugin",
+}
+ACCEPTED_IMAGE_FORMATS = tuple(IMAGE_FORMAT_PLUGINS)
+
+
+def preload_image_plugins() -> None:
+    """Register the Pillow plugins for the accepted formats only.
+
+    Pillow falls back to importing every plugin it ships with when asked about a
+    format it has not registered yet, so the accepted ones are loaded up front.
+    """
+
+    for plugin in IMAGE_FORMAT_PLUGINS.values():
+        importlib.import_module(f"PIL.{plugin}")
+
 
 def resize_image(
         image: Image.Image,
@@ -63,6 +85,7 @@ def change_image_format(
 ) -> Image.Image:
     """change image format"""
 
+    Image.init() # register every plugin so all savable formats are known
     acceptable_fmts = set(Image.SAVE.keys())
 
     if fmt.upper() not in acceptable_fmts: